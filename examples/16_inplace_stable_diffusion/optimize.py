@@ -16,12 +16,14 @@
 import logging
 import os
 import time
+import weakref
 
 # pytype: disable=import-error
 import diffusers
 import torch
 import transformers
 from diffusers import DPMSolverMultistepScheduler, StableDiffusionPipeline
+from diffusers.models.attention_processor import Attention
 from transformers.modeling_outputs import BaseModelOutputWithPooling
 
 import model_navigator as nav
@@ -39,24 +41,56 @@ LOGGER = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 DEVICE = torch.device("cuda")
+# samples are converted to NumPy, which has no bfloat16, so the pipeline runs in FP16
+DTYPE = torch.float16
 
 # workaround to make transformers use the same device as model navigator
 transformers.modeling_utils.get_parameter_device = lambda parameter: DEVICE
 diffusers.models.modeling_utils.get_parameter_device = lambda parameter: DEVICE
 
 
+class CachedContextProjection(torch.nn.Module):
+    """Projection of the text context which is reused as long as the same context tensor is passed.
+
+    The pipeline passes the same `encoder_hidden_states` tensor to the U-Net in every denoising step,
+    so cross-attention keys and values are computed once per prompt instead of once per step.
+    """
+
+    def __init__(self, projection: torch.nn.Module):
+        super().__init__()
+        self.projection = projection
+        self._context = None
+        self._output = None
+
+    def forward(self, context, *args, **kwargs):
+        if self._context is None or self._context() is not context:
+            self._context = weakref.ref(context)
+            self._output = self.projection(context, *args, **kwargs)
+        return self._output
+
+
+def cache_cross_attention_projections(unet):
+    cross_attentions = [m for m in unet.modules() if isinstance(m, Attention) and m.is_cross_attention]
+    for attention in cross_attentions:
+        attention.to_k = CachedContextProjection(attention.to_k)
+        attention.to_v = CachedContextProjection(attention.to_v)
+
+
 def get_pipeline():
     model_id = "stabilityai/stable-diffusion-2-1"
-    pipe = StableDiffusionPipeline.from_pretrained(model_id)
+    pipe = StableDiffusionPipeline.from_pretrained(model_id, torch_dtype=DTYPE)
     pipe.scheduler = DPMSolverMultistepScheduler.from_config(pipe.scheduler.config)
     pipe = pipe.to(DEVICE)
+    cache_cross_attention_projections(pipe.unet)
 
     optimize_config = nav.OptimizeConfig(
         batching=False,
         target_formats=(nav.Format.TENSORRT,),
         runners=(
             "TorchCUDA",
+            "TorchCompileCUDA",
             "TensorRT",
+            "TensorRTCUDAGraph",
         ),
         custom_configs=[nav.TensorRTConfig(precision=nav.TensorRTPrecision.FP16)],
     )
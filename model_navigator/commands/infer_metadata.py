@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Inputs and outputs metadata commands."""
+import itertools
 import pathlib
-from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -30,6 +31,8 @@ from model_navigator.frameworks.onnx.utils import get_onnx_io_names
 from model_navigator.runners.utils import get_format_default_runners
 from model_navigator.utils.format_helpers import FRAMEWORK2BASE_FORMAT
 
+_NO_SAMPLE = object()
+
 
 def _extract_axes_shapes(
     dataloader: Union[SizedDataLoader, Iterator],
@@ -39,59 +42,144 @@ def _extract_axes_shapes(
     num_samples: int,
     framework: Framework,
     check_len: bool = True,
-) -> Dict[str, Dict[int, List[int]]]:
-    assert not (check_len) or isinstance(
-        dataloader, (SizedIterable, Sequence)
-    ), "dataloader is not an instance of SizedDataLoader, unable to check length."
-
-    axes_shapes = {name: {ax: [] for ax in range(ndim)} for name, ndim in zip(input_names, input_ndims)}
-    for i, sample in enumerate(dataloader):
-        if i >= num_samples:
-            LOGGER.warning(f"{len(dataloader)=}, but more samples found.")
+    first_sample: Optional[Dict[str, np.ndarray]] = None,
+) -> Dict[str, np.ndarray]:
+    if first_sample is None:
+        # dataloader samples share the structure of the first one (inputs are checked against the pytree metadata
+        # beforehand, outputs come from the same model), so only the first one needs to be validated
+        samples = _validate_first_sample(dataloader, framework)
+    else:
+        # the first sample was already validated and flattened by the caller
+        samples = itertools.islice(dataloader, 1, None)
+
+    if check_len:
+        assert isinstance(
+            dataloader, (SizedIterable, Sequence)
+        ), "dataloader is not an instance of SizedDataLoader, unable to check length."
+        return _extract_axes_shapes_sized(
+            dataloader, samples, pytree_metadata, input_names, input_ndims, num_samples, framework, first_sample
+        )
+
+    return _extract_axes_shapes_stream(
+        samples, pytree_metadata, input_names, input_ndims, num_samples, framework, first_sample
+    )
+
+
+def _validate_first_sample(dataloader: Union[SizedDataLoader, Iterator], framework: Framework) -> Iterator:
+    samples = iter(dataloader)
+    first_sample = next(samples, _NO_SAMPLE)
+    if first_sample is _NO_SAMPLE:
+        return samples
+
+    validate_sample_input(first_sample, FRAMEWORK_TO_TENSOR_TYPE[framework])
+    return itertools.chain([first_sample], samples)
+
+
+def _allocate_axes_shapes(input_names: Sequence[str], input_ndims: Sequence[int], num_samples: int):
+    # shapes are stored as a compact (num_samples, ndim) int64 array per tensor - 8 bytes per dimension
+    # keeps exact per-axis min/median/max reductions cheap without holding boxed Python ints per sample
+    return {name: np.empty((num_samples, ndim), dtype=np.int64) for name, ndim in zip(input_names, input_ndims)}
+
+
+def _fill_first_sample_shapes(
+    axes_shapes: Dict[str, np.ndarray], first_sample: Optional[Dict[str, np.ndarray]] = None
+) -> int:
+    if first_sample is None:
+        return 0
+    for name, tensor in first_sample.items():
+        axes_shapes[name][0] = tensor.shape
+    return 1
+
+
+def _extract_axes_shapes_sized(
+    dataloader: SizedDataLoader,
+    samples: Iterator,
+    pytree_metadata: PyTreeMetadata,
+    input_names: Sequence[str],
+    input_ndims: Sequence[int],
+    num_samples: int,
+    framework: Framework,
+    first_sample: Optional[Dict[str, np.ndarray]] = None,
+) -> Dict[str, np.ndarray]:
+    num_samples = min(num_samples, len(dataloader))
+    axes_shapes = _allocate_axes_shapes(input_names, input_ndims, num_samples)
+    collected = _fill_first_sample_shapes(axes_shapes, first_sample)
+    for sample in samples:
+        if collected >= num_samples:
+            if num_samples == len(dataloader):
+                LOGGER.warning(f"{len(dataloader)=}, but more samples found.")
             break
-        validate_sample_input(sample, FRAMEWORK_TO_TENSOR_TYPE[framework])
         sample = {n: to_numpy(t, framework) for n, t in pytree_metadata.flatten_sample(sample).items()}
         for name, tensor in sample.items():
-            for k, dim in enumerate(tensor.shape):
-                axes_shapes[name][k].append(dim)
+            axes_shapes[name][collected] = tensor.shape
+        collected += 1
 
-    if check_len:
-        assert i + 1 >= len(dataloader), f"{len(dataloader)=}, but only {i + 1} samples found."
+    assert collected == num_samples, f"{len(dataloader)=}, expected {num_samples} samples, but only {collected} found."
 
     return axes_shapes
 
 
+def _extract_axes_shapes_stream(
+    samples: Iterator,
+    pytree_metadata: PyTreeMetadata,
+    input_names: Sequence[str],
+    input_ndims: Sequence[int],
+    num_samples: int,
+    framework: Framework,
+    first_sample: Optional[Dict[str, np.ndarray]] = None,
+) -> Dict[str, np.ndarray]:
+    axes_shapes = _allocate_axes_shapes(input_names, input_ndims, num_samples)
+    collected = _fill_first_sample_shapes(axes_shapes, first_sample)
+    for sample in samples:
+        if collected >= num_samples:
+            LOGGER.warning(f"More than {num_samples} samples found, remaining samples are ignored.")
+            break
+        sample = {n: to_numpy(t, framework) for n, t in pytree_metadata.flatten_sample(sample).items()}
+        for name, tensor in sample.items():
+            axes_shapes[name][collected] = tensor.shape
+        collected += 1
+
+    return {name: shapes[:collected] for name, shapes in axes_shapes.items()}
+
+
 def _get_metadata_from_axes_shapes(pytree_metadata, axes_shapes, batch_dim, dtypes):
     metadata = TensorMetadata(pytree_metadata=pytree_metadata)
-    for name, axes in axes_shapes.items():
-        tensor_shape = []
-        for ax, shapes in axes.items():
-            if ax == batch_dim or min(shapes) != max(shapes):
-                tensor_shape.append(-1)
-            else:
-                tensor_shape.append(shapes[0])
-        metadata.add(name, tuple(tensor_shape), dtypes[name])
+    for name, shapes in axes_shapes.items():
+        dynamic_axes = shapes.min(axis=0) != shapes.max(axis=0)
+        if batch_dim is not None and shapes.shape[1]:
+            dynamic_axes[batch_dim] = True
+        tensor_shape = np.where(dynamic_axes, -1, shapes[0])
+        metadata.add(name, tuple(tensor_shape.tolist()), dtypes[name])
     return metadata
 
 
-def _extract_max_batch_size(axes_shapes: Dict[str, Dict[int, List[int]]], batch_dim: Optional[int]) -> int:
+def _extract_max_batch_size(axes_shapes: Dict[str, np.ndarray], batch_dim: Optional[int]) -> int:
     if batch_dim is not None:
-        return max(list(axes_shapes.values())[0][batch_dim])
+        return int(next(iter(axes_shapes.values()))[:, batch_dim].max())
     return 0
 
 
 def _get_trt_profile_from_axes_shapes(axes_shapes, batch_dim, max_batch_size=None):
     trt_profile = TensorRTProfile()
-    for name, axes in axes_shapes.items():
-        min_max_opt = []
-        for ax, shapes in axes.items():
-            if ax == batch_dim:  # min bs = 1
-                max_batch_size = max_batch_size or max(shapes)
-                min_max_opt.append((1, int(np.median(shapes)), max_batch_size))
-            else:
-                min_max_opt.append((min(shapes), int(np.median(shapes)), max(shapes)))
-        if min_max_opt:
-            trt_profile.add(name, *list(zip(*min_max_opt)))
+    for name, shapes in axes_shapes.items():
+        if not shapes.shape[1]:
+            continue
+        if batch_dim is None and (shapes == shapes[0]).all():  # static shape, nothing to sort
+            shape = tuple(shapes[0].tolist())
+            trt_profile.add(name, shape, shape, shape)
+            continue
+        # a single sort along samples yields min, median and max of every axis at once
+        sorted_shapes = np.sort(shapes, axis=0)
+        num_samples = len(sorted_shapes)
+        # copies, with a single sample the first and last rows are the same row
+        mins = sorted_shapes[0].copy()
+        opts = (sorted_shapes[(num_samples - 1) // 2] + sorted_shapes[num_samples // 2]) // 2
+        maxs = sorted_shapes[-1].copy()
+        if batch_dim is not None:  # min bs = 1
+            max_batch_size = max_batch_size or int(maxs[batch_dim])
+            mins[batch_dim] = 1
+            maxs[batch_dim] = max_batch_size
+        trt_profile.add(name, tuple(mins.tolist()), tuple(opts.tolist()), tuple(maxs.tolist()))
     return trt_profile
 
 
@@ -151,7 +239,7 @@ class InferInputMetadata(Command, is_required=True):
         input_dtypes = {n: t.dtype for n, t in input_sample.items()}
         num_samples = len(dataloader)
         axes_shapes = _extract_axes_shapes(
-            dataloader, pytree_metadata, input_names, input_ndims, num_samples, framework
+            dataloader, pytree_metadata, input_names, input_ndims, num_samples, framework, first_sample=input_sample
         )
         dataloader_max_batch_size = _extract_max_batch_size(axes_shapes, batch_dim)
         dataloader_trt_profile = _get_trt_profile_from_axes_shapes(axes_shapes, batch_dim)
@@ -268,7 +356,6 @@ class InferOutputMetadata(Command, is_required=True):
             disable_fallback=False,
         )  # pytype: disable=not-instantiable
 
-        profiling_sample = load_samples("profiling_sample", workspace.path, batch_dim)[0]
         conversion_samples = load_samples("conversion_sample", workspace.path, batch_dim)
 
         with runner, ExecutionContext(workspace=workspace, verbose=verbose):
@@ -276,19 +363,27 @@ class InferOutputMetadata(Command, is_required=True):
                 "check_inputs": False,
                 "return_raw_outputs": True,
             }
-            outputs = runner.infer(profiling_sample, **kwargs)
+            output_generator = (runner.infer(sample, **kwargs) for sample in conversion_samples)
+            # outputs of the first conversion sample are used to discover the outputs structure
+            # and are then fed back into the shapes extraction pass together with the remaining ones
+            outputs = next(output_generator)
             pytree_metadata = PyTreeMetadata.from_sample(
                 outputs, tensor_type=FRAMEWORK_TO_TENSOR_TYPE[framework], names=_output_names, prefix="output"
             )
             output_sample = {n: to_numpy(t, framework) for n, t in pytree_metadata.flatten_sample(outputs).items()}
             output_names = list(output_sample.keys())
-            output_generator = (runner.infer(sample, **kwargs) for sample in conversion_samples)
 
             output_ndims = [t.ndim for t in output_sample.values()]
             output_dtypes = {n: t.dtype for n, t in output_sample.items()}
             num_samples = len(dataloader)
             axes_shapes = _extract_axes_shapes(
-                output_generator, pytree_metadata, output_names, output_ndims, num_samples, framework, check_len=False
+                itertools.chain([outputs], output_generator),
+                pytree_metadata,
+                output_names,
+                output_ndims,
+                num_samples,
+                framework,
+                check_len=False,
             )
 
         output_metadata = _get_metadata_from_axes_shapes(pytree_metadata, axes_shapes, batch_dim, output_dtypes)
@@ -241,6 +241,10 @@ class PyTreeMetadata:
         """Create PyTreeMetadata from provided metadata."""
         self._metadata = metadata
         self.tensor_type = tensor_type
+        # flat dictionaries where each key names its own tensor are flattened to themselves
+        self._is_identity_mapping = isinstance(metadata, Mapping) and all(
+            isinstance(name, str) and key == name for key, name in metadata.items()
+        )
 
     def __str__(self) -> str:
         """Convert PyTree metadata to string."""
@@ -296,6 +300,9 @@ class PyTreeMetadata:
 
         Returns flatten dictionary with keys corresponding to PyTree metadata.
         """
+        if self._is_identity_mapping and isinstance(sample, Mapping) and sample.keys() == self._metadata.keys():
+            return dict(sample)
+
         flattened_sample = {}
         self._flatten_sample(sample, self._metadata, flattened_sample)
         return flattened_sample
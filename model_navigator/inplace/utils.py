@@ -14,9 +14,10 @@
 """Inplace Optimize utility functions."""
 
 import pathlib
-from collections import defaultdict
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from model_navigator.commands.infer_metadata import _get_trt_profile_from_axes_shapes
 from model_navigator.core.tensor import PyTreeMetadata
 from model_navigator.utils.module import lazy_import
@@ -56,15 +57,11 @@ class TorchDataloader:
 def _extract_axes_shapes(
     shapes: List[Dict[str, List[int]]],
     pytree_metadata: PyTreeMetadata,
-) -> Dict[str, Dict[int, List[int]]]:
-
-    axes_shapes = {name: defaultdict(list) for name in pytree_metadata.get_names()}
-    for sample_shapes in shapes:
-        for name, tensor_shape in sample_shapes.items():
-            for k, dim in enumerate(tensor_shape):
-                axes_shapes[name][k].append(dim)
-
-    return axes_shapes
+) -> Dict[str, np.ndarray]:
+    return {
+        name: np.asarray([sample_shapes[name] for sample_shapes in shapes], dtype=np.int64).reshape(len(shapes), -1)
+        for name in pytree_metadata.get_names()
+    }
 
 
 def get_trt_profile_from_shapes(
@@ -83,9 +80,11 @@ def get_dynamic_axes_from_shapes(
 ):
     """Get dynamic axes from shapes."""
     axes_shapes = _extract_axes_shapes(shapes, pytree_metadata)
-    dynamic_axes = defaultdict(list)
-    for name, axes_shapes_ in axes_shapes.items():
-        for axis, shapes in axes_shapes_.items():
-            if axis == batch_dim or min(shapes) != max(shapes):
-                dynamic_axes[name].append(axis)
-    return dict(dynamic_axes)
+    dynamic_axes = {}
+    for name, shapes_ in axes_shapes.items():
+        is_dynamic = shapes_.min(axis=0) != shapes_.max(axis=0)
+        if batch_dim is not None and shapes_.shape[1]:
+            is_dynamic[batch_dim] = True
+        if is_dynamic.any():
+            dynamic_axes[name] = np.flatnonzero(is_dynamic).tolist()
+    return dynamic_axes
@@ -23,6 +23,7 @@ from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.configuration.model.model_config import ModelConfig
 from model_navigator.pipelines.pipeline import Pipeline
 from model_navigator.runners.registry import runner_registry
+from model_navigator.utils.config_helpers import is_requested_format
 from model_navigator.utils.format_helpers import is_source_format
 
 
@@ -46,6 +47,7 @@ def performance_builder(config: CommonConfig, models_config: Dict[Format, List[M
             for runner in runner_registry.values():
                 if (
                     runner.format() == model_config.format
+                    and is_requested_format(config, model_config.format)
                     and runner.name() in config.runner_names
                     and config.target_device in runner.devices_kind()
                 ):
@@ -56,6 +56,9 @@ class Pipeline:
         """
         LOGGER.info(pad_string(f"Pipeline {self.name!r} started"))
 
+        # Units are executed one by one on purpose, even if their `requires` do not depend on each other.
+        # They share the source model object, the logger handlers and stdout redirection,
+        # and performance measurements require exclusive access to the device.
         for execution_unit in self.execution_units:
             command_output = self._execute_unit(
                 workspace=workspace,
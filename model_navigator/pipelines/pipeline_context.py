@@ -260,7 +260,7 @@ class PipelineContext:
 
                 input_args[key] = value
 
-        _update_args(data={**execution_unit.kwargs})
+        _update_args(data=execution_unit.kwargs)
 
         if execution_unit.model_config:
             model_config_data = execution_unit.model_config.get_config_dict_for_command()
@@ -269,7 +269,7 @@ class PipelineContext:
             if execution_unit.runner_cls:
                 _update_args(data={"runner_cls": execution_unit.runner_cls})
 
-            model_commands = self._commands.models_commands.get(execution_unit.model_config.key)
+            model_commands = self._commands.models_commands.get(model_config_data["key"])
             if model_commands:
                 for model_command in model_commands.commands.values():
                     _update_args(data=model_command.output)
@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Helper function for runners."""
-from typing import List, Type
+import functools
+from typing import List, Tuple, Type
 
 from model_navigator.api.config import Format
 from model_navigator.core.logger import LOGGER
@@ -83,8 +84,13 @@ def get_format_default_runners(format: Format) -> List[Type[NavigatorRunner]]:
     Raises:
         ValueError if provided format is not a source format
     """
+    return list(_get_format_default_runners(format))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_format_default_runners(format: Format) -> Tuple[Type[NavigatorRunner], ...]:
     if is_source_format(format):
-        return get_source_default_runners(format)
+        return tuple(get_source_default_runners(format))
     runners = []
     for runner_cls in runner_registry.values():
         if runner_cls.format() == format:
@@ -93,5 +99,5 @@ def get_format_default_runners(format: Format) -> List[Type[NavigatorRunner]]:
         LOGGER.info(
             f"Using default runners: `{[runner_cls.name() for runner_cls in runners]}` for format `{format.value}`."
         )
-        return runners
+        return tuple(runners)
     raise ValueError(f"No runner available for format `{format.value}`.")
@@ -23,6 +23,7 @@ from model_navigator.configuration.model.model_config import (
     TorchTensorRTConfig,
 )
 from model_navigator.core.logger import LOGGER
+from model_navigator.utils.format_helpers import FRAMEWORK2BASE_FORMAT
 
 
 def do_find_device_max_batch_size(config: CommonConfig, models_config: Dict[Format, List[ModelConfig]]) -> bool:
@@ -56,6 +57,22 @@ def do_find_device_max_batch_size(config: CommonConfig, models_config: Dict[Form
     return True
 
 
+def is_requested_format(config: CommonConfig, model_format: Format) -> bool:
+    """Verify if models in provided format were requested by the user.
+
+    Intermediate formats which are produced only to obtain one of the target formats
+    (e.g. ONNX when only TensorRT is requested) are not evaluated for correctness and performance.
+
+    Args:
+        config: A configuration for pipelines
+        model_format: Format of the model
+
+    Returns:
+        True if format is one of the target formats or the base format of the framework, False otherwise
+    """
+    return model_format in config.target_formats or model_format == FRAMEWORK2BASE_FORMAT[config.framework]
+
+
 def _do_run_max_batch_size_search(
     config: CommonConfig,
     model_cfg: Union[TensorRTConfig, TensorFlowTensorRTConfig, TorchTensorRTConfig],
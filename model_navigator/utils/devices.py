@@ -14,6 +14,7 @@
 """Device utils."""
 
 import ctypes
+import functools
 import logging
 import uuid
 from ctypes import c_uint8
@@ -122,6 +123,10 @@ def get_environment_info(gpus: Optional[Sequence[str]] = None):
     return info
 
 
+@functools.lru_cache(maxsize=None)
 def is_cuda_available():
-    """Return True if CUDA available, False otherwise."""
+    """Return True if CUDA available, False otherwise.
+
+    The result is cached as GPUs visible to the process do not change during its lifetime.
+    """
     return bool(get_gpus(["all"]))
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Test for API configs"""
+import re
+
 import pytest
 
 from model_navigator.api.config import (
@@ -27,7 +29,6 @@ from model_navigator.api.config import (
     TensorRTConfig,
     TensorRTPrecision,
     TensorRTPrecisionMode,
-    TensorRTProfile,
     TorchConfig,
     TorchTensorRTConfig,
     _custom_configs,
@@ -35,46 +36,44 @@ from model_navigator.api.config import (
 )
 from model_navigator.exceptions import ModelNavigatorConfigurationError
 
+OPTIMIZATION_LEVEL_ERRORS = {
+    level: re.compile(rf"TensorRT `optimization_level` must be between 0 and 5\. Provided value: {level}\.")
+    for level in (6, -1)
+}
 
-def test_tensorrt_config_raise_exception_when_trt_profile_and_trt_profiles_are_both_set():
-    with pytest.raises(ModelNavigatorConfigurationError):
-        TensorRTConfig(trt_profile=TensorRTProfile(), trt_profiles=[TensorRTProfile()])
-
-
-def test_tensorflow_tensorrt_config_raise_exception_when_trt_profile_and_trt_profiles_are_both_set():
-    with pytest.raises(ModelNavigatorConfigurationError):
-        TensorFlowTensorRTConfig(trt_profile=TensorRTProfile(), trt_profiles=[TensorRTProfile()])
+TENSORRT_BASED_CONFIGS = [TensorRTConfig, TensorFlowTensorRTConfig, TorchTensorRTConfig]
 
 
-def test_torch_tensorrt_config_raise_exception_when_trt_profile_and_trt_profiles_are_both_set():
+@pytest.mark.parametrize("config_cls", TENSORRT_BASED_CONFIGS, ids=lambda config_cls: config_cls.name())
+def test_tensorrt_based_config_raise_exception_when_trt_profile_and_trt_profiles_are_both_set(
+    config_cls, empty_trt_profile
+):
     with pytest.raises(ModelNavigatorConfigurationError):
-        TorchTensorRTConfig(trt_profile=TensorRTProfile(), trt_profiles=[TensorRTProfile()])
+        config_cls(trt_profile=empty_trt_profile, trt_profiles=[empty_trt_profile])
 
 
-def test_tensorrt_based_format_constructs_correctly_with_trt_profile():
-    TensorRTConfig(trt_profile=TensorRTProfile())
-    TensorFlowTensorRTConfig(trt_profile=TensorRTProfile())
-    TorchTensorRTConfig(trt_profile=TensorRTProfile())
+def test_tensorrt_based_format_constructs_correctly_with_trt_profile(empty_trt_profile):
+    TensorRTConfig(trt_profile=empty_trt_profile)
+    TensorFlowTensorRTConfig(trt_profile=empty_trt_profile)
+    TorchTensorRTConfig(trt_profile=empty_trt_profile)
 
 
-def test_tensorrt_based_format_constructs_correctly_with_trt_profiles():
-    trt_profiles = [TensorRTProfile(), TensorRTProfile(), TensorRTProfile()]
+def test_tensorrt_based_format_constructs_correctly_with_trt_profiles(empty_trt_profile):
+    trt_profiles = [empty_trt_profile, empty_trt_profile, empty_trt_profile]
 
     TensorRTConfig(trt_profiles=trt_profiles)
     TensorFlowTensorRTConfig(trt_profiles=trt_profiles)
     TorchTensorRTConfig(trt_profiles=trt_profiles)
 
 
-def test_tensorrt_based_configs_return_valid_profiles():
-    trt_profile = TensorRTProfile().add(name="input_0", min=(224, 224, 3), opt=(224, 224, 3), max=(224, 224, 3))
-
-    assert TensorRTConfig(trt_profile=trt_profile).trt_profiles[0] == trt_profile
-    assert TensorFlowTensorRTConfig(trt_profile=trt_profile).trt_profiles[0] == trt_profile
-    assert TorchTensorRTConfig(trt_profile=trt_profile).trt_profiles[0] == trt_profile
+def test_tensorrt_based_configs_return_valid_profiles(sample_trt_profile):
+    assert TensorRTConfig(trt_profile=sample_trt_profile).trt_profiles[0] == sample_trt_profile
+    assert TensorFlowTensorRTConfig(trt_profile=sample_trt_profile).trt_profiles[0] == sample_trt_profile
+    assert TorchTensorRTConfig(trt_profile=sample_trt_profile).trt_profiles[0] == sample_trt_profile
 
-    assert TensorRTConfig(trt_profiles=[trt_profile]).trt_profiles[0] == trt_profile
-    assert TensorFlowTensorRTConfig(trt_profiles=[trt_profile]).trt_profiles[0] == trt_profile
-    assert TorchTensorRTConfig(trt_profiles=[trt_profile]).trt_profiles[0] == trt_profile
+    assert TensorRTConfig(trt_profiles=[sample_trt_profile]).trt_profiles[0] == sample_trt_profile
+    assert TensorFlowTensorRTConfig(trt_profiles=[sample_trt_profile]).trt_profiles[0] == sample_trt_profile
+    assert TorchTensorRTConfig(trt_profiles=[sample_trt_profile]).trt_profiles[0] == sample_trt_profile
 
 
 def test_tensorflow_config_has_valid_name_and_format():
@@ -89,12 +88,6 @@ def test_tensorflow_tensorrt_config_has_valid_name_and_format():
     assert config.format == Format.TF_TRT
 
 
-def test_tensorflow_tensorrt_config_defaults_reset_values_to_initial():
-    config = TensorFlowTensorRTConfig(precision=(TensorRTPrecision.FP32,))
-    config.defaults()
-    assert config.precision == DEFAULT_TENSORRT_PRECISION
-
-
 def test_torch_config_has_valid_name_and_format():
     config = TorchConfig()
     assert config.name() == "Torch"
@@ -119,16 +112,6 @@ def test_torch_tensorrt_config_has_valid_name_and_format():
     assert config.format == Format.TORCH_TRT
 
 
-def test_torch_tensorrt_config_defaults_reset_values_to_initial():
-    config = TorchTensorRTConfig(
-        precision=(TensorRTPrecision.FP32,),
-        precision_mode=TensorRTPrecisionMode.MIXED,
-    )
-    config.defaults()
-    assert config.precision == DEFAULT_TENSORRT_PRECISION
-    assert config.precision_mode == DEFAULT_TENSORRT_PRECISION_MODE
-
-
 def test_onnx_config_has_valid_name_and_format():
     config = OnnxConfig()
     assert config.name() == "Onnx"
@@ -141,8 +124,9 @@ def test_tensorrt_config_has_valid_name_and_format():
     assert config.format == Format.TENSORRT
 
 
-def test_tensorrt_config_defaults_reset_values_to_initial():
-    config = TensorRTConfig(
+@pytest.mark.parametrize("config_cls", TENSORRT_BASED_CONFIGS, ids=lambda config_cls: config_cls.name())
+def test_tensorrt_based_config_defaults_reset_values_to_initial(config_cls):
+    config = config_cls(
         precision=(TensorRTPrecision.FP32,),
         precision_mode=TensorRTPrecisionMode.MIXED,
     )
@@ -178,16 +162,10 @@ def test_map_custom_configs_return_dict_when_passed_list_of_configs():
 
 
 def test_tensorrt_config_raise_error_when_invalid_optimization_level_provided():
-    with pytest.raises(
-        ModelNavigatorConfigurationError,
-        match="TensorRT `optimization_level` must be between 0 and 5. Provided value: 6.",
-    ):
+    with pytest.raises(ModelNavigatorConfigurationError, match=OPTIMIZATION_LEVEL_ERRORS[6]):
         TensorRTConfig(optimization_level=6)
 
-    with pytest.raises(
-        ModelNavigatorConfigurationError,
-        match="TensorRT `optimization_level` must be between 0 and 5. Provided value: -1.",
-    ):
+    with pytest.raises(ModelNavigatorConfigurationError, match=OPTIMIZATION_LEVEL_ERRORS[-1]):
         TensorRTConfig(optimization_level=-1)
 
     config = TensorRTConfig(optimization_level=2)
@@ -221,38 +199,34 @@ def test_custom_configs_raise_error_when_config_with_duplicated_format_defined()
         _custom_configs()
 
 
-def test_optimization_profile_raise_error_when_windows_size_less_than_1():
-    with pytest.raises(ModelNavigatorConfigurationError, match="`window_size` must be greater or equal 1."):
-        OptimizationProfile(window_size=0)
-
-
-def test_optimization_profile_raise_error_when_stabilization_windows_less_than_1():
-    with pytest.raises(ModelNavigatorConfigurationError, match="`stabilization_windows` must be greater or equal 1."):
-        OptimizationProfile(stabilization_windows=0)
-
-
-def test_optimization_profile_raise_error_when_min_trials_less_than_1():
-    with pytest.raises(ModelNavigatorConfigurationError, match="`min_trials` must be greater or equal 1."):
-        OptimizationProfile(min_trials=0)
-
-
-def test_optimization_profile_raise_error_when_max_trials_less_than_1():
-    with pytest.raises(ModelNavigatorConfigurationError, match="`max_trials` must be greater or equal 1."):
-        OptimizationProfile(max_trials=0)
-
-
-def test_optimization_profile_raise_error_when_stability_percentage_equal_0():
-    with pytest.raises(ModelNavigatorConfigurationError, match="`stability_percentage` must be greater than 0.0."):
-        OptimizationProfile(stability_percentage=0.0)
-
-
-def test_optimization_profile_raise_error_when_min_trials_less_than_stabilization_windows():
-    with pytest.raises(
-        ModelNavigatorConfigurationError, match="`min_trials` must be greater or equal than `stabilization_windows`."
-    ):
-        OptimizationProfile(stabilization_windows=2, min_trials=1)
-
-
-def test_optimization_profile_raise_error_when_max_trials_less_than_min_trials():
-    with pytest.raises(ModelNavigatorConfigurationError, match="`max_trials` must be greater or equal `min_trials`."):
-        OptimizationProfile(max_trials=1, min_trials=2, stabilization_windows=1)
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        pytest.param({"window_size": 0}, re.compile(r"`window_size` must be greater or equal 1\."), id="window_size<1"),
+        pytest.param(
+            {"stabilization_windows": 0},
+            re.compile(r"`stabilization_windows` must be greater or equal 1\."),
+            id="stabilization_windows<1",
+        ),
+        pytest.param({"min_trials": 0}, re.compile(r"`min_trials` must be greater or equal 1\."), id="min_trials<1"),
+        pytest.param({"max_trials": 0}, re.compile(r"`max_trials` must be greater or equal 1\."), id="max_trials<1"),
+        pytest.param(
+            {"stability_percentage": 0.0},
+            re.compile(r"`stability_percentage` must be greater than 0\.0\."),
+            id="stability_percentage=0",
+        ),
+        pytest.param(
+            {"stabilization_windows": 2, "min_trials": 1},
+            re.compile(r"`min_trials` must be greater or equal than `stabilization_windows`\."),
+            id="min_trials<stabilization_windows",
+        ),
+        pytest.param(
+            {"max_trials": 1, "min_trials": 2, "stabilization_windows": 1},
+            re.compile(r"`max_trials` must be greater or equal `min_trials`\."),
+            id="max_trials<min_trials",
+        ),
+    ],
+)
+def test_optimization_profile_raise_error_when_invalid_parameters_passed(kwargs, match):
+    with pytest.raises(ModelNavigatorConfigurationError, match=match):
+        OptimizationProfile(**kwargs)
@@ -18,12 +18,76 @@ import pytest
 from model_navigator.api.config import TensorRTProfile, TensorType
 from model_navigator.commands.infer_metadata import (
     _assert_all_inputs_have_same_pytree_metadata,
+    _extract_axes_shapes,
     _extract_max_batch_size,
     _get_metadata_from_axes_shapes,
     _get_trt_profile_from_axes_shapes,
 )
 from model_navigator.core.tensor import PyTreeMetadata, TensorSpec
 from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.frameworks import Framework
+
+DTYPE_FLOAT64 = numpy.dtype("float64")
+
+
+def test_extract_axes_shapes_reuse_first_sample_when_first_sample_passed():
+    input_name = "input_0"
+    dataloader = [{input_name: numpy.zeros((batch_size, 3))} for batch_size in range(1, 5)]
+    first_sample = {input_name: numpy.zeros((8, 3))}
+
+    axes_shapes = _extract_axes_shapes(
+        dataloader=dataloader,
+        pytree_metadata=PyTreeMetadata({input_name: input_name}, TensorType.NUMPY),
+        input_names=[input_name],
+        input_ndims=[2],
+        num_samples=len(dataloader),
+        framework=Framework.NONE,
+        first_sample=first_sample,
+    )
+
+    numpy.testing.assert_array_equal(axes_shapes[input_name], numpy.array([[8, 3], [2, 3], [3, 3], [4, 3]]))
+
+
+def test_extract_axes_shapes_read_only_num_samples_when_num_samples_less_than_dataloader_length():
+    input_name = "input_0"
+    dataloader = [{input_name: numpy.zeros((batch_size, 3))} for batch_size in range(1, 5)]
+
+    axes_shapes = _extract_axes_shapes(
+        dataloader=dataloader,
+        pytree_metadata=PyTreeMetadata({input_name: input_name}, TensorType.NUMPY),
+        input_names=[input_name],
+        input_ndims=[2],
+        num_samples=2,
+        framework=Framework.NONE,
+    )
+
+    numpy.testing.assert_array_equal(axes_shapes[input_name], numpy.array([[1, 3], [2, 3]]))
+
+
+def test_extract_axes_shapes_log_warning_when_dataloader_yields_more_samples_than_its_length(mocker):
+    input_name = "input_0"
+
+    class UnderreportedDataloader:
+        def __len__(self):
+            return 2
+
+        def __iter__(self):
+            return iter([{input_name: numpy.zeros((batch_size, 3))} for batch_size in range(1, 5)])
+
+    dataloader = UnderreportedDataloader()
+    logger = mocker.patch("model_navigator.commands.infer_metadata.LOGGER")
+
+    axes_shapes = _extract_axes_shapes(
+        dataloader=dataloader,
+        pytree_metadata=PyTreeMetadata({input_name: input_name}, TensorType.NUMPY),
+        input_names=[input_name],
+        input_ndims=[2],
+        num_samples=len(dataloader),
+        framework=Framework.NONE,
+    )
+
+    numpy.testing.assert_array_equal(axes_shapes[input_name], numpy.array([[1, 3], [2, 3]]))
+    logger.warning.assert_called_once()
 
 
 def test_extract_max_batch_size_return_correct_value_when_multiple_values_passed():
@@ -31,12 +95,15 @@ def test_extract_max_batch_size_return_correct_value_when_multiple_values_passed
     max_batch_size = 999
     batch_dim = 0
     axes_shapes = {
-        input_name: {
-            0: [5, max_batch_size, 1, 3, 7],  # batch dimension
-            1: [224, 224, 224, 224, 224],
-            2: [224, 224, 224, 224, 224],
-            3: [3, 3, 3, 3, 3],
-        }
+        input_name: numpy.array(
+            [
+                [5, 224, 224, 3],
+                [max_batch_size, 224, 224, 3],
+                [1, 224, 224, 3],
+                [3, 224, 224, 3],
+                [7, 224, 224, 3],
+            ]
+        )
     }
 
     batch_size = _extract_max_batch_size(axes_shapes=axes_shapes, batch_dim=batch_dim)
@@ -46,9 +113,7 @@ def test_extract_max_batch_size_return_correct_value_when_multiple_values_passed
 
 def test_get_trt_profile_return_correct_shapes_when_axes_shapes_passed():
     input_name = "input_0"
-    axes_shapes = {
-        input_name: {0: [1, 1, 1, 1, 1], 1: [224, 224, 224, 224, 224], 2: [224, 224, 224, 224, 224], 3: [3, 3, 3, 3, 3]}
-    }
+    axes_shapes = {input_name: numpy.array([[1, 224, 224, 3]] * 5)}
     batch_dim = 0
 
     expected_trt_profile = TensorRTProfile().add(
@@ -63,17 +128,47 @@ def test_get_trt_profile_return_correct_shapes_when_axes_shapes_passed():
     assert trt_profile[input_name].max == expected_trt_profile[input_name].max
 
 
+@pytest.mark.parametrize(
+    "max_batch_size,expected_max",
+    [
+        pytest.param(None, (4, 3), id="dataloader_max_batch_size"),
+        pytest.param(8, (8, 3), id="explicit_max_batch_size"),
+    ],
+)
+def test_get_trt_profile_return_dynamic_batch_when_single_sample_passed(max_batch_size, expected_max):
+    axes_shapes = {"input_0": numpy.array([[4, 3]])}
+
+    trt_profile = _get_trt_profile_from_axes_shapes(axes_shapes=axes_shapes, batch_dim=0, max_batch_size=max_batch_size)
+
+    assert trt_profile["input_0"].min == (1, 3)
+    assert trt_profile["input_0"].opt == (4, 3)
+    assert trt_profile["input_0"].max == expected_max
+
+
+def test_get_trt_profile_return_static_shapes_when_no_batch_dim_and_shapes_are_constant():
+    axes_shapes = {
+        "input_0": numpy.array([[224, 224, 3]] * 5),
+        "input_1": numpy.array([[8], [16], [4]]),
+    }
+
+    trt_profile = _get_trt_profile_from_axes_shapes(axes_shapes=axes_shapes, batch_dim=None)
+
+    assert trt_profile["input_0"].min == (224, 224, 3)
+    assert trt_profile["input_0"].opt == (224, 224, 3)
+    assert trt_profile["input_0"].max == (224, 224, 3)
+    assert trt_profile["input_1"].min == (4,)
+    assert trt_profile["input_1"].opt == (8,)
+    assert trt_profile["input_1"].max == (16,)
+
+
 def test_get_metadata_return_correct_data_from_axes_shapes_when_with_valid_shapes_passed():
     batch_dim = 0
     input_name = "input_0"
-    dtype_name = "float64"
-    dtypes = {input_name: dtype_name}
-    axes_shapes = {
-        input_name: {0: [1, 1, 1, 1, 1], 1: [224, 224, 224, 224, 224], 2: [224, 224, 224, 224, 224], 3: [3, 3, 3, 3, 3]}
-    }
+    dtypes = {input_name: DTYPE_FLOAT64.name}
+    axes_shapes = {input_name: numpy.array([[1, 224, 224, 3]] * 5)}
 
     expected_metadata = {
-        input_name: TensorSpec(name=input_name, shape=(-1, 224, 224, 3), dtype=numpy.dtype(dtype_name), optional=False)
+        input_name: TensorSpec(name=input_name, shape=(-1, 224, 224, 3), dtype=DTYPE_FLOAT64, optional=False)
     }
     metadata = _get_metadata_from_axes_shapes(
         pytree_metadata=PyTreeMetadata(None, TensorType.NUMPY),
@@ -85,50 +180,55 @@ def test_get_metadata_return_correct_data_from_axes_shapes_when_with_valid_shape
     assert metadata == expected_metadata
 
 
-def test_assert_all_inputs_have_same_pytree_metadata_raise_no_exception_when_inputs_have_same_metadata():
-    valid_dataloaders = [
-        [
-            numpy.zeros(2),
-            numpy.zeros(2),
-        ],
-        [
-            {"input_0": numpy.zeros(2), "input_1": numpy.zeros(3)},
-            {"input_1": numpy.zeros(3), "input_0": numpy.zeros(2)},
-        ],
-        [
-            (numpy.zeros(2), True),
-            (numpy.zeros(2), True),
-        ],
-    ]
-
-    for dataloader in valid_dataloaders:
-        pytree_metadata = PyTreeMetadata.from_sample(dataloader[0], TensorType.NUMPY, prefix="dummy")
+VALID_DATALOADERS = [
+    [
+        numpy.zeros(2),
+        numpy.zeros(2),
+    ],
+    [
+        {"input_0": numpy.zeros(2), "input_1": numpy.zeros(3)},
+        {"input_1": numpy.zeros(3), "input_0": numpy.zeros(2)},
+    ],
+    [
+        (numpy.zeros(2), True),
+        (numpy.zeros(2), True),
+    ],
+]
+
+INVALID_DATALOADERS = [
+    [
+        numpy.zeros(2),
+        (numpy.zeros(2),),
+    ],
+    [
+        {"input_0": numpy.zeros(2), "input_1": numpy.zeros(3)},
+        {"input_0": numpy.zeros(2), "input_1": numpy.zeros(3), "input_2": numpy.zeros(3)},
+    ],
+    [
+        (numpy.zeros(2), True),
+        (numpy.zeros(2), False),
+    ],
+    [
+        (numpy.zeros(2), False, 1.0),
+        (numpy.zeros(2), False, 2.0),
+    ],
+]
+
+
+@pytest.mark.parametrize("dataloader", VALID_DATALOADERS, ids=["tensor", "dict", "tuple_with_constant"])
+def test_assert_all_inputs_have_same_pytree_metadata_raise_no_exception_when_inputs_have_same_metadata(dataloader):
+    pytree_metadata = PyTreeMetadata.from_sample(dataloader[0], TensorType.NUMPY, prefix="dummy")
+
+    _assert_all_inputs_have_same_pytree_metadata(dataloader, pytree_metadata)
+
+
+@pytest.mark.parametrize(
+    "dataloader",
+    INVALID_DATALOADERS,
+    ids=["tensor_and_tuple", "dict_with_extra_key", "different_bool_constant", "different_float_constant"],
+)
+def test_assert_all_inputs_have_same_pytree_metadata_raise_exception_when_inputs_have_different_metadata(dataloader):
+    pytree_metadata = PyTreeMetadata.from_sample(dataloader[0], TensorType.NUMPY, prefix="dummy")
 
+    with pytest.raises(ModelNavigatorUserInputError):
         _assert_all_inputs_have_same_pytree_metadata(dataloader, pytree_metadata)
-
-
-def test_assert_all_inputs_have_same_pytree_metadata_raise_exception_when_inputs_have_different_metadata():
-    invalid_dataloaders = [
-        [
-            numpy.zeros(2),
-            (numpy.zeros(2),),
-        ],
-        [
-            {"input_0": numpy.zeros(2), "input_1": numpy.zeros(3)},
-            {"input_0": numpy.zeros(2), "input_1": numpy.zeros(3), "input_2": numpy.zeros(3)},
-        ],
-        [
-            (numpy.zeros(2), True),
-            (numpy.zeros(2), False),
-        ],
-        [
-            (numpy.zeros(2), False, 1.0),
-            (numpy.zeros(2), False, 2.0),
-        ],
-    ]
-
-    for dataloader in invalid_dataloaders:
-        pytree_metadata = PyTreeMetadata.from_sample(dataloader[0], TensorType.NUMPY, prefix="dummy")
-
-        with pytest.raises(ModelNavigatorUserInputError):
-            _assert_all_inputs_have_same_pytree_metadata(dataloader, pytree_metadata)
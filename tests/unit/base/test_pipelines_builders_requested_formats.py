@@ -0,0 +1,80 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+
+import pytest
+
+from model_navigator.api.config import (
+    DeviceKind,
+    Format,
+    JitType,
+    OptimizationProfile,
+    TensorRTPrecision,
+    TensorRTPrecisionMode,
+)
+from model_navigator.configuration.common_config import CommonConfig
+from model_navigator.configuration.model.model_config import (
+    ONNXConfig,
+    TensorRTConfig,
+    TorchModelConfig,
+    TorchScriptConfig,
+)
+from model_navigator.core.constants import DEFAULT_MAX_WORKSPACE_SIZE
+from model_navigator.frameworks import Framework
+from model_navigator.pipelines.builders.correctness import correctness_builder
+from model_navigator.pipelines.builders.performance import performance_builder
+from model_navigator.pipelines.builders.verify import verify_builder
+from model_navigator.runners.registry import runner_registry
+from model_navigator.runners.tensorrt import TensorRTRunner
+
+
+@pytest.mark.parametrize("builder", [correctness_builder, performance_builder, verify_builder])
+def test_builder_skip_intermediate_formats_when_only_tensorrt_is_requested(builder, mocker):
+    # TensorRT runners are registered only when TensorRT is installed
+    mocker.patch.dict(runner_registry, {TensorRTRunner.name(): TensorRTRunner})
+
+    config = CommonConfig(
+        framework=Framework.TORCH,
+        dataloader=[{"input_name": [idx]} for idx in range(10)],
+        model=None,
+        optimization_profile=OptimizationProfile(),
+        runner_names=tuple(runner_registry.keys()),
+        sample_count=10,
+        target_formats=(Format.TENSORRT,),
+        target_device=DeviceKind.CUDA,
+    )
+
+    models_config = {
+        Format.TORCH: [TorchModelConfig()],
+        Format.TORCHSCRIPT: [
+            TorchScriptConfig(
+                jit_type=JitType.TRACE,
+                strict=True,
+            )
+        ],
+        Format.ONNX: [ONNXConfig(opset=17, dynamic_axes={})],
+        Format.TENSORRT: [
+            TensorRTConfig(
+                precision=TensorRTPrecision.FP16,
+                precision_mode=TensorRTPrecisionMode.HIERARCHY,
+                max_workspace_size=DEFAULT_MAX_WORKSPACE_SIZE,
+                optimization_level=None,
+                compatibility_level=None,
+            )
+        ],
+    }
+    pipeline = builder(config=config, models_config=models_config)
+
+    formats = {execution_unit.model_config.format for execution_unit in pipeline.execution_units}
+    assert Format.ONNX not in formats
+    assert Format.TORCHSCRIPT not in formats
+    assert formats == {Format.TORCH, Format.TENSORRT}
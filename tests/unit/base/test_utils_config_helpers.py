@@ -29,7 +29,11 @@ from model_navigator.configuration.model.model_config import (
 )
 from model_navigator.core.constants import DEFAULT_MAX_WORKSPACE_SIZE
 from model_navigator.frameworks import Framework
-from model_navigator.utils.config_helpers import _do_run_max_batch_size_search, do_find_device_max_batch_size
+from model_navigator.utils.config_helpers import (
+    _do_run_max_batch_size_search,
+    do_find_device_max_batch_size,
+    is_requested_format,
+)
 
 
 def test__do_run_max_batch_size_search_return_false_when_batch_dim_is_none():
@@ -199,3 +203,21 @@ def test_do_find_device_max_batch_size_return_false_when_no_adaptive_conversion_
     }
 
     assert do_find_device_max_batch_size(config, models_config) is False
+
+
+def test_is_requested_format_return_true_only_for_target_and_base_formats():
+    config = CommonConfig(
+        framework=Framework.TORCH,
+        dataloader=[{"input_name": [idx]} for idx in range(10)],
+        model=None,
+        optimization_profile=OptimizationProfile(),
+        runner_names=(),
+        sample_count=10,
+        target_formats=(Format.TENSORRT,),
+        target_device=DeviceKind.CUDA,
+    )
+
+    assert is_requested_format(config, Format.TENSORRT) is True
+    assert is_requested_format(config, Format.TORCH) is True
+    assert is_requested_format(config, Format.ONNX) is False
+    assert is_requested_format(config, Format.TORCHSCRIPT) is False
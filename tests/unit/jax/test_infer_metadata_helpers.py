@@ -24,9 +24,7 @@ def test_extract_axes_shapes_return_correct_shapes_when_valid_dataloader_used():
     num_samples = 5
     shape = (1, 224, 224, 3)
     input_name = "input_0"
-    expected_axes_shapes = {
-        input_name: {0: [1, 1, 1, 1, 1], 1: [224, 224, 224, 224, 224], 2: [224, 224, 224, 224, 224], 3: [3, 3, 3, 3, 3]}
-    }
+    expected_axes_shapes = {input_name: numpy.array([shape] * num_samples)}
 
     axes_shapes = _extract_axes_shapes(
         dataloader=[{input_name: numpy.full(shape=shape, fill_value=1)} for _ in range(num_samples)],
@@ -38,4 +36,5 @@ def test_extract_axes_shapes_return_correct_shapes_when_valid_dataloader_used():
         check_len=True,
     )
 
-    assert axes_shapes == expected_axes_shapes
+    assert axes_shapes.keys() == expected_axes_shapes.keys()
+    numpy.testing.assert_array_equal(axes_shapes[input_name], expected_axes_shapes[input_name])
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy
 import torch  # pytype: disable=import-error
 
 from model_navigator.api.config import TensorType
@@ -24,9 +25,7 @@ def test_extract_axes_shapes_from_valid_dataloader_torch():
     num_samples = 5
     shape = (1, 224, 224, 3)
     input_name = "input_0"
-    expected_axes_shapes = {
-        input_name: {0: [1, 1, 1, 1, 1], 1: [224, 224, 224, 224, 224], 2: [224, 224, 224, 224, 224], 3: [3, 3, 3, 3, 3]}
-    }
+    expected_axes_shapes = {input_name: numpy.array([shape] * num_samples)}
 
     axes_shapes = _extract_axes_shapes(
         dataloader=[{input_name: torch.full(size=shape, fill_value=1)} for _ in range(num_samples)],
@@ -38,4 +37,5 @@ def test_extract_axes_shapes_from_valid_dataloader_torch():
         check_len=True,
     )
 
-    assert axes_shapes == expected_axes_shapes
+    assert axes_shapes.keys() == expected_axes_shapes.keys()
+    numpy.testing.assert_array_equal(axes_shapes[input_name], expected_axes_shapes[input_name])